@@ -4,6 +4,15 @@ extends Node
 ## Central signal hub for loose coupling between game systems.
 ## All cross-system communication should go through this bus to avoid
 ## tight dependencies between components.
+##
+## High-frequency combat events (attacks, hits, damage, floating text) do not
+## use signals. They are queued into a CombatEventBatch and delivered to
+## subscribers once per frame - see the BATCHED COMBAT EVENTS section below.
+
+# =============================================================================
+# PRELOADED DEPENDENCIES
+# =============================================================================
+const CombatEventBatch = preload("res://scripts/combat/combat_event_batch.gd")
 
 # =============================================================================
 # TOWER SIGNALS
@@ -41,18 +50,6 @@ signal tower_evolved(tower: Node, new_stage: int, new_digimon: String, dp_used:
 ## new_origin: The survivor's new origin (if changed)
 signal merge_completed(survivor: Node, sacrificed: Node, new_dp: int, new_origin: int)
 
-## Emitted when a tower starts attacking
-## tower: The attacking tower
-## target: The enemy being attacked
-signal tower_attack_started(tower: Node, target: Node)
-
-## Emitted when a tower's attack deals damage
-## tower: The attacking tower
-## target: The enemy hit
-## damage: Amount of damage dealt
-## is_critical: Whether it was a critical hit
-signal tower_attack_hit(tower: Node, target: Node, damage: float, is_critical: bool)
-
 # =============================================================================
 # ENEMY SIGNALS
 # =============================================================================
@@ -74,13 +71,6 @@ signal enemy_killed(enemy: Node, killer: Node, reward: int)
 ## is_boss: Whether this was a boss (affects life penalty)
 signal enemy_escaped(enemy: Node, is_boss: bool)
 
-## Emitted when an enemy takes damage
-## enemy: The enemy node
-## damage: Amount of damage taken
-## source: The damage source (tower, effect, etc.)
-## damage_type: Type of damage (physical, fire, ice, etc.)
-signal enemy_damaged(enemy: Node, damage: float, source: Node, damage_type: String)
-
 ## Emitted when a status effect is applied to an enemy
 ## enemy: The affected enemy
 ## effect_name: Name of the effect (burn, freeze, slow, etc.)
@@ -175,12 +165,6 @@ signal placement_mode_ended()
 ## cost: DigiBytes spent
 signal tower_placed_via_dragdrop(grid_pos: Vector2i, stage: int, attribute: int, cost: int)
 
-## Emitted to show floating text (damage numbers, rewards, etc.)
-## position: World position to show text
-## text: The text to display
-## color: Text color
-signal floating_text_requested(position: Vector2, text: String, color: Color)
-
 # =============================================================================
 # GAME STATE SIGNALS
 # =============================================================================
@@ -197,6 +181,218 @@ signal wave_start_requested()
 signal checkpoint_reached(wave_number: int)
 
 
+# =============================================================================
+# BATCHED COMBAT EVENTS
+# =============================================================================
+# Attacks, hits, damage and floating text fire many times per frame once the
+# field fills up, so they are buffered into a CombatEventBatch and handed to
+# each subscriber once per frame instead of going through signal dispatch.
+
+## Subscribers: Array of {"callback": Callable, "mask": int}
+var _combat_subscribers: Array[Dictionary] = []
+
+## Events queued this frame (delivered on the next flush)
+var _pending_batch: CombatEventBatch = CombatEventBatch.new()
+
+## Batch being delivered; swapped with _pending_batch on flush so events
+## queued by subscribers during delivery go out next frame
+var _delivering_batch: CombatEventBatch = CombatEventBatch.new()
+
+## Union of all subscriber masks (event types anyone is listening to)
+var _combat_subscribed_mask: int = 0
+
+## Total events queued per type since the last stats reset
+var _combat_emit_counts: PackedInt64Array = PackedInt64Array()
+
+## Total batches delivered since the last stats reset
+var _combat_flush_count: int = 0
+
+## True while flush_combat_events() is delivering a batch
+var _is_flushing: bool = false
+
+
+func _init() -> void:
+	_combat_emit_counts.resize(CombatEventBatch.TYPE_COUNT)
+
+
+func _ready() -> void:
+	# Flush after every other node has processed this frame, even when paused
+	process_mode = Node.PROCESS_MODE_ALWAYS
+	process_priority = 1000
+	# Only process while events are pending
+	set_process(not _pending_batch.is_empty())
+
+
+func _process(_delta: float) -> void:
+	flush_combat_events()
+
+
+## Subscribe to batched combat events
+## callback: Called once per frame with a CombatEventBatch holding the
+##           matching events. Not called on frames with no matching events.
+##           The batch is only valid for the duration of the call.
+## types: CombatEventBatch.Type values to receive (empty = all types)
+func subscribe_combat_events(callback: Callable, types: Array = []) -> void:
+	var mask = CombatEventBatch.types_to_mask(types)
+	for subscriber in _combat_subscribers:
+		if subscriber["callback"] == callback:
+			subscriber["mask"] = mask
+			_update_combat_subscribed_mask()
+			return
+	_combat_subscribers.append({"callback": callback, "mask": mask})
+	_update_combat_subscribed_mask()
+
+
+## Remove a batched combat event subscriber
+func unsubscribe_combat_events(callback: Callable) -> void:
+	for i in range(_combat_subscribers.size() - 1, -1, -1):
+		if _combat_subscribers[i]["callback"] == callback:
+			# Clear the mask so a flush in progress skips it too
+			_combat_subscribers[i]["mask"] = 0
+			_combat_subscribers.remove_at(i)
+	_update_combat_subscribed_mask()
+
+
+## Check if a callback is subscribed to batched combat events
+func is_subscribed_to_combat_events(callback: Callable) -> bool:
+	for subscriber in _combat_subscribers:
+		if subscriber["callback"] == callback:
+			return true
+	return false
+
+
+## Queue a tower starting an attack
+func queue_tower_attack_started(tower: Node, target: Node) -> void:
+	_queue_combat_event(CombatEventBatch.Type.ATTACK_STARTED, tower, target)
+
+
+## Queue a tower's attack dealing damage
+func queue_tower_attack_hit(tower: Node, target: Node, damage: float, is_critical: bool) -> void:
+	_queue_combat_event(CombatEventBatch.Type.ATTACK_HIT, tower, target, damage, is_critical)
+
+
+## Queue an enemy taking damage
+## source: The damage source (tower, effect, etc.), can be null for DoT
+## damage_type: Type of damage (physical, fire, ice, etc.)
+func queue_enemy_damaged(enemy: Node, damage: float, source: Node, damage_type: String) -> void:
+	_queue_combat_event(
+		CombatEventBatch.Type.ENEMY_DAMAGED, source, enemy, damage, false, Vector2.ZERO, damage_type
+	)
+
+
+## Queue floating text (damage numbers, rewards, etc.)
+func queue_floating_text(position: Vector2, text: String, color: Color) -> void:
+	_queue_combat_event(
+		CombatEventBatch.Type.FLOATING_TEXT, null, null, 0.0, false, position, text, color
+	)
+
+
+## Deliver all pending combat events to subscribers.
+## Called automatically at the end of each frame; call directly to flush early.
+## Calls made from inside a subscriber callback are ignored - events queued
+## during delivery go out on the next frame.
+## Unsubscribing during delivery takes effect immediately.
+func flush_combat_events() -> void:
+	if _is_flushing:
+		return
+	set_process(false)
+	if _pending_batch.is_empty():
+		return
+	_is_flushing = true
+
+	var batch = _pending_batch
+	_pending_batch = _delivering_batch
+	_delivering_batch = batch
+	_combat_flush_count += 1
+
+	# Subscribers sharing a filter share one filtered batch
+	var filtered_batches: Dictionary = {CombatEventBatch.ALL_TYPES_MASK: batch}
+	var subscribers = _combat_subscribers.duplicate()
+	for subscriber in subscribers:
+		var callback: Callable = subscriber["callback"]
+		if not callback.is_valid():
+			unsubscribe_combat_events(callback)
+			continue
+		var mask: int = subscriber["mask"]
+		# Unsubscribed earlier in this flush
+		if mask == 0:
+			continue
+		if not filtered_batches.has(mask):
+			filtered_batches[mask] = batch.filtered(mask)
+		var subscriber_batch: CombatEventBatch = filtered_batches[mask]
+		if not subscriber_batch.is_empty():
+			callback.call(subscriber_batch)
+
+	batch.clear()
+	_is_flushing = false
+
+
+## Get the number of events queued but not yet delivered
+func get_pending_combat_event_count() -> int:
+	return _pending_batch.size()
+
+
+## Get how many events of a type have been queued since the last stats reset
+func get_combat_event_emit_count(type: int) -> int:
+	if type < 0 or type >= _combat_emit_counts.size():
+		return 0
+	return _combat_emit_counts[type]
+
+
+## Get how many subscribers receive events of a type
+func get_combat_event_subscriber_count(type: int) -> int:
+	var type_mask = CombatEventBatch.type_to_mask(type)
+	var count = 0
+	for subscriber in _combat_subscribers:
+		if subscriber["mask"] & type_mask:
+			count += 1
+	return count
+
+
+## Get emit and subscriber counts for every combat event type (for debugging)
+## Returns: {"flushes": int, "events": {type_name: {"emitted": int, "subscribers": int}}}
+func get_combat_event_stats() -> Dictionary:
+	var events = {}
+	for type_name in CombatEventBatch.Type.keys():
+		var type = CombatEventBatch.Type[type_name]
+		events[type_name] = {
+			"emitted": get_combat_event_emit_count(type),
+			"subscribers": get_combat_event_subscriber_count(type),
+		}
+	return {"flushes": _combat_flush_count, "events": events}
+
+
+## Reset combat event emit and flush counters
+func reset_combat_event_stats() -> void:
+	_combat_emit_counts.fill(0)
+	_combat_flush_count = 0
+
+
+func _queue_combat_event(
+	type: int,
+	source: Node = null,
+	target: Node = null,
+	amount: float = 0.0,
+	is_critical: bool = false,
+	position: Vector2 = Vector2.ZERO,
+	text: String = "",
+	color: Color = Color.WHITE
+) -> void:
+	_combat_emit_counts[type] += 1
+	# Nobody is listening for this type - count it but skip buffering
+	if not (_combat_subscribed_mask & CombatEventBatch.type_to_mask(type)):
+		return
+	_pending_batch.append(type, source, target, amount, is_critical, position, text, color)
+	if not is_processing():
+		set_process(true)
+
+
+func _update_combat_subscribed_mask() -> void:
+	_combat_subscribed_mask = 0
+	for subscriber in _combat_subscribers:
+		_combat_subscribed_mask |= subscriber["mask"]
+
+
 # =============================================================================
 # HELPER METHODS
 # =============================================================================
@@ -207,14 +403,14 @@ func show_damage_number(position: Vector2, damage: float, is_critical: bool = fa
 	var text = str(int(damage))
 	if is_critical:
 		text = text + "!"
-	floating_text_requested.emit(position, text, color)
+	queue_floating_text(position, text, color)
 
 
 ## Convenience method to emit floating reward text
 func show_reward_text(position: Vector2, amount: int) -> void:
-	floating_text_requested.emit(position, "+" + str(amount) + " DB", Color.GOLD)
+	queue_floating_text(position, "+" + str(amount) + " DB", Color.GOLD)
 
 
 ## Convenience method to emit floating level up text
 func show_level_up_text(position: Vector2, new_level: int) -> void:
-	floating_text_requested.emit(position, "Lv " + str(new_level), Color.CYAN)
+	queue_floating_text(position, "Lv " + str(new_level), Color.CYAN)
@@ -0,0 +1,180 @@
+class_name CombatEventBatch
+extends RefCounted
+## One frame's worth of high-frequency combat events stored as packed arrays.
+##
+## EventBus buffers attack, damage and floating text events into a batch and
+## hands it to each subscriber once per frame instead of emitting a signal per
+## event. Every event occupies one index across the parallel arrays; fields an
+## event type does not use are left at their zero value.
+##
+## Nodes are stored as instance IDs so a batch never keeps a freed tower or
+## enemy alive. Use get_source()/get_target() to resolve them; both return
+## null if the node has been freed since the event was queued.
+##
+## Usage:
+##   func _on_combat_events(batch: CombatEventBatch) -> void:
+##       for i in batch.size():
+##           if batch.get_type(i) == CombatEventBatch.Type.ATTACK_HIT:
+##               _total_damage += batch.get_amount(i)
+
+## High-frequency combat event types
+enum Type {
+	ATTACK_STARTED,   ## source: tower, target: enemy
+	ATTACK_HIT,       ## source: tower, target: enemy, amount: damage, critical
+	ENEMY_DAMAGED,    ## source: damage source, target: enemy, amount: damage, text: damage type
+	FLOATING_TEXT,    ## position, text, color
+}
+
+## Number of event types (size of per-type stat arrays)
+const TYPE_COUNT: int = Type.size()
+
+## Filter mask matching every event type
+const ALL_TYPES_MASK: int = (1 << TYPE_COUNT) - 1
+
+## Event type per index (Type enum values)
+var types: PackedByteArray = PackedByteArray()
+
+## Instance ID of the event source (0 if none)
+var source_ids: PackedInt64Array = PackedInt64Array()
+
+## Instance ID of the event target (0 if none)
+var target_ids: PackedInt64Array = PackedInt64Array()
+
+## Damage amount for ATTACK_HIT and ENEMY_DAMAGED
+var amounts: PackedFloat64Array = PackedFloat64Array()
+
+## 1 if the hit was critical, 0 otherwise
+var criticals: PackedByteArray = PackedByteArray()
+
+## World position for FLOATING_TEXT
+var positions: PackedVector2Array = PackedVector2Array()
+
+## Damage type for ENEMY_DAMAGED, display text for FLOATING_TEXT
+var texts: PackedStringArray = PackedStringArray()
+
+## Text color for FLOATING_TEXT
+var colors: PackedColorArray = PackedColorArray()
+
+
+## Get the filter mask bit for a single event type
+static func type_to_mask(type: int) -> int:
+	return 1 << type
+
+
+## Build a filter mask from an array of Type values (empty = all types)
+static func types_to_mask(filter_types: Array) -> int:
+	if filter_types.is_empty():
+		return ALL_TYPES_MASK
+	var mask = 0
+	for type in filter_types:
+		mask |= type_to_mask(type)
+	return mask
+
+
+## Append one event to the batch
+func append(
+	type: int,
+	source: Object = null,
+	target: Object = null,
+	amount: float = 0.0,
+	critical: bool = false,
+	position: Vector2 = Vector2.ZERO,
+	text: String = "",
+	color: Color = Color.WHITE
+) -> void:
+	types.append(type)
+	source_ids.append(source.get_instance_id() if is_instance_valid(source) else 0)
+	target_ids.append(target.get_instance_id() if is_instance_valid(target) else 0)
+	amounts.append(amount)
+	criticals.append(1 if critical else 0)
+	positions.append(position)
+	texts.append(text)
+	colors.append(color)
+
+
+## Number of events in the batch
+func size() -> int:
+	return types.size()
+
+
+## Check if the batch holds no events
+func is_empty() -> bool:
+	return types.is_empty()
+
+
+## Remove all events (keeps the arrays for reuse)
+func clear() -> void:
+	types.clear()
+	source_ids.clear()
+	target_ids.clear()
+	amounts.clear()
+	criticals.clear()
+	positions.clear()
+	texts.clear()
+	colors.clear()
+
+
+## Count the events of a given type
+func count_type(type: int) -> int:
+	return types.count(type)
+
+
+## Build a new batch holding only the events whose type is in the mask
+func filtered(mask: int) -> CombatEventBatch:
+	var result := CombatEventBatch.new()
+	for i in types.size():
+		if mask & type_to_mask(types[i]):
+			result.types.append(types[i])
+			result.source_ids.append(source_ids[i])
+			result.target_ids.append(target_ids[i])
+			result.amounts.append(amounts[i])
+			result.criticals.append(criticals[i])
+			result.positions.append(positions[i])
+			result.texts.append(texts[i])
+			result.colors.append(colors[i])
+	return result
+
+
+# =============================================================================
+# PER-EVENT ACCESSORS
+# =============================================================================
+
+func get_type(index: int) -> int:
+	return types[index]
+
+
+## Get the source node, or null if none was set or it has been freed
+func get_source(index: int) -> Object:
+	return _resolve(source_ids[index])
+
+
+## Get the target node, or null if none was set or it has been freed
+func get_target(index: int) -> Object:
+	return _resolve(target_ids[index])
+
+
+func get_amount(index: int) -> float:
+	return amounts[index]
+
+
+func is_critical(index: int) -> bool:
+	return criticals[index] != 0
+
+
+func get_position(index: int) -> Vector2:
+	return positions[index]
+
+
+func get_text(index: int) -> String:
+	return texts[index]
+
+
+func get_color(index: int) -> Color:
+	return colors[index]
+
+
+func _resolve(instance_id: int) -> Object:
+	if instance_id == 0:
+		return null
+	var obj = instance_from_id(instance_id)
+	return obj if is_instance_valid(obj) else null
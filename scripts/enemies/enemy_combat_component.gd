@@ -120,6 +120,8 @@ func take_damage(amount: float, source: Node, damage_type: String = "") -> void:
 	# Emit signals
 	damaged.emit(final_damage, source)
 	hp_changed.emit(current_hp, max_hp)
+	if EventBus:
+		EventBus.queue_enemy_damaged(enemy, final_damage, source, damage_type)
 
 	# Update visuals
 	_update_health_bar()
@@ -142,6 +144,8 @@ func take_dot_damage(amount: float, effect_name: String = "") -> void:
 
 	current_hp -= amount
 	hp_changed.emit(current_hp, max_hp)
+	if EventBus:
+		EventBus.queue_enemy_damaged(enemy, amount, null, effect_name)
 	_update_health_bar()
 
 	if current_hp <= 0:
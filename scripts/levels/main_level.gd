@@ -289,7 +289,7 @@ func _on_placement_cancelled() -> void:
 func _on_placement_invalid(grid_pos: Vector2i, reason: String) -> void:
 	## Handle invalid placement attempt - show feedback
 	var world_pos = grid_to_world(grid_pos)
-	EventBus.floating_text_requested.emit(world_pos, reason, Color.RED)
+	EventBus.queue_floating_text(world_pos, reason, Color.RED)
 
 
 func _on_enemy_killed(_enemy: Node, _killer: Node, _reward: int) -> void:
@@ -62,7 +62,6 @@ func _ready() -> void:
 
 	# Connect to EventBus if available
 	if EventBus:
-		EventBus.tower_attack_started.connect(_on_tower_attack_started)
 		# Connect to enemy lifecycle signals for cache management
 		EventBus.enemy_spawned.connect(_on_enemy_spawned)
 		EventBus.enemy_killed.connect(_on_enemy_killed)
@@ -271,12 +270,6 @@ func _on_projectile_destroyed(projectile: Projectile) -> void:
 	active_projectiles.erase(projectile)
 
 
-## Handle tower attack event
-func _on_tower_attack_started(_tower: Node, _target: Node) -> void:
-	# This can be used for global attack tracking/effects
-	pass
-
-
 # =============================================================================
 # ENEMY CACHE MANAGEMENT
 # =============================================================================
@@ -328,8 +321,6 @@ func get_cached_enemy_count() -> int:
 func _exit_tree() -> void:
 	# Disconnect from EventBus signals to prevent memory leaks
 	if EventBus:
-		if EventBus.tower_attack_started.is_connected(_on_tower_attack_started):
-			EventBus.tower_attack_started.disconnect(_on_tower_attack_started)
 		if EventBus.enemy_spawned.is_connected(_on_enemy_spawned):
 			EventBus.enemy_spawned.disconnect(_on_enemy_spawned)
 		if EventBus.enemy_killed.is_connected(_on_enemy_killed):
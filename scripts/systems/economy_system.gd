@@ -157,7 +157,7 @@ func sell_tower(tower: Node) -> int:
 
 	if EventBus:
 		EventBus.tower_sold.emit(tower, value)
-		EventBus.floating_text_requested.emit(
+		EventBus.queue_floating_text(
 			tower.global_position,
 			"+%d DB" % value,
 			Color.GOLD
@@ -173,7 +173,7 @@ func execute_evolution(tower: DigimonTower, evolution_path: EvolutionPath) -> vo
 
 	if EventBus:
 		EventBus.tower_evolved.emit(tower, new_digimon.stage, new_digimon.digimon_name, dp_used)
-		EventBus.floating_text_requested.emit(
+		EventBus.queue_floating_text(
 			tower.global_position,
 			"DIGIVOLVE!",
 			Color.MAGENTA
@@ -168,7 +168,7 @@ func execute_merge(source: DigimonTower, target: DigimonTower) -> void:
 
 	# Show floating text
 	if EventBus:
-		EventBus.floating_text_requested.emit(
+		EventBus.queue_floating_text(
 			target.global_position,
 			"+1 DP",
 			Color.GOLD
@@ -194,7 +194,7 @@ func _perform_attack() -> void:
 			# Emit signals
 			attack_started.emit(_target)
 			if EventBus:
-				EventBus.tower_attack_started.emit(tower, _target)
+				EventBus.queue_tower_attack_started(tower, _target)
 	else:
 		# Fallback: Direct damage (instant attack)
 		var damage_result = DamageCalculator.calculate_damage(tower, _target, tower.digimon_data.base_damage)
@@ -222,8 +222,8 @@ func _perform_attack() -> void:
 		attack_hit.emit(_target, damage_result["damage"], damage_result["is_critical"])
 
 		if EventBus:
-			EventBus.tower_attack_started.emit(tower, _target)
-			EventBus.tower_attack_hit.emit(tower, _target, damage_result["damage"], damage_result["is_critical"])
+			EventBus.queue_tower_attack_started(tower, _target)
+			EventBus.queue_tower_attack_hit(tower, _target, damage_result["damage"], damage_result["is_critical"])
 
 		# Apply status effect if applicable
 		DamageCalculator.apply_effect(tower, _target)
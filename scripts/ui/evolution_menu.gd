@@ -400,7 +400,7 @@ func _on_confirm_pressed() -> void:
 		AudioManager.play_sfx("insufficient_funds")
 		ErrorHandler.log_warning("EvolutionMenu", "Cannot afford evolution cost: %d DB" % cost)
 		if EventBus:
-			EventBus.floating_text_requested.emit(
+			EventBus.queue_floating_text(
 				_current_tower.global_position,
 				"Need %d DB!" % cost,
 				Color.RED
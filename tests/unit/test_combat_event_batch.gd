@@ -0,0 +1,321 @@
+extends GutTest
+## Unit tests for batched combat events (CombatEventBatch and EventBus channel).
+##
+## Tests batch storage, per-frame delivery, type filters and emit/subscriber
+## stats. A fresh EventBus instance is used so the autoload is not affected.
+
+# =============================================================================
+# PRELOADS
+# =============================================================================
+
+const EventBusScript = preload("res://scripts/autoload/event_bus.gd")
+const CombatEventBatchScript = preload("res://scripts/combat/combat_event_batch.gd")
+
+# =============================================================================
+# TEST VARIABLES
+# =============================================================================
+
+var _event_bus: Node = null
+
+## Event types received per delivered batch (one PackedByteArray per call)
+var _received: Array = []
+
+## Process frame number of each delivered batch
+var _received_frames: Array[int] = []
+
+## Node used as a tower/enemy stand-in
+var _node: Node = null
+
+
+# =============================================================================
+# SETUP AND TEARDOWN
+# =============================================================================
+
+func before_all() -> void:
+	gut.p("Starting CombatEventBatch unit tests")
+
+
+func after_all() -> void:
+	gut.p("Completed CombatEventBatch unit tests")
+
+
+func before_each() -> void:
+	_event_bus = EventBusScript.new()
+	add_child(_event_bus)
+	_node = Node.new()
+	add_child(_node)
+	_received = []
+	_received_frames = []
+
+
+func after_each() -> void:
+	if _event_bus:
+		_event_bus.queue_free()
+		_event_bus = null
+	if _node:
+		_node.queue_free()
+		_node = null
+
+
+func _record_batch(batch: CombatEventBatchScript) -> void:
+	_received.append(batch.types.duplicate())
+	_received_frames.append(Engine.get_process_frames())
+
+
+## Wait until the current frame's _process calls have run.
+## process_frame is emitted before nodes process, so a single await would
+## resume before EventBus flushes.
+func _wait_for_frame_end() -> void:
+	await get_tree().process_frame
+	await get_tree().process_frame
+
+
+# =============================================================================
+# BATCH TESTS
+# =============================================================================
+
+func test_batch_starts_empty() -> void:
+	var batch = CombatEventBatchScript.new()
+	assert_true(batch.is_empty(), "New batch should be empty")
+	assert_eq(batch.size(), 0, "New batch should have size 0")
+
+
+func test_batch_append_stores_all_fields() -> void:
+	var batch = CombatEventBatchScript.new()
+	batch.append(CombatEventBatchScript.Type.ATTACK_HIT, _node, _node, 42.0, true)
+	batch.append(CombatEventBatchScript.Type.FLOATING_TEXT, null, null, 0.0, false,
+		Vector2(10, 20), "+1 DP", Color.GOLD)
+
+	assert_eq(batch.size(), 2, "Batch should hold two events")
+	assert_eq(batch.get_type(0), CombatEventBatchScript.Type.ATTACK_HIT, "First event type")
+	assert_eq(batch.get_source(0), _node, "Source should resolve to the node")
+	assert_eq(batch.get_amount(0), 42.0, "Amount should be stored")
+	assert_true(batch.is_critical(0), "Critical flag should be stored")
+	assert_null(batch.get_source(1), "Unset source should resolve to null")
+	assert_eq(batch.get_position(1), Vector2(10, 20), "Position should be stored")
+	assert_eq(batch.get_text(1), "+1 DP", "Text should be stored")
+	assert_eq(batch.get_color(1), Color.GOLD, "Color should be stored")
+
+
+func test_batch_freed_node_resolves_to_null() -> void:
+	var batch = CombatEventBatchScript.new()
+	var temp = Node.new()
+	batch.append(CombatEventBatchScript.Type.ATTACK_STARTED, temp, null)
+	temp.free()
+	assert_null(batch.get_source(0), "Freed source should resolve to null")
+
+
+func test_batch_filtered_keeps_matching_types() -> void:
+	var batch = CombatEventBatchScript.new()
+	batch.append(CombatEventBatchScript.Type.ATTACK_STARTED)
+	batch.append(CombatEventBatchScript.Type.ATTACK_HIT, null, null, 5.0)
+	batch.append(CombatEventBatchScript.Type.ATTACK_STARTED)
+
+	var mask = CombatEventBatchScript.type_to_mask(CombatEventBatchScript.Type.ATTACK_HIT)
+	var result = batch.filtered(mask)
+	assert_eq(result.size(), 1, "Only ATTACK_HIT should remain")
+	assert_eq(result.get_amount(0), 5.0, "Fields should be copied with the event")
+	assert_eq(batch.size(), 3, "Original batch should be unchanged")
+
+
+func test_batch_clear_empties_batch() -> void:
+	var batch = CombatEventBatchScript.new()
+	batch.append(CombatEventBatchScript.Type.ATTACK_STARTED)
+	batch.clear()
+	assert_true(batch.is_empty(), "Batch should be empty after clear")
+
+
+func test_types_to_mask_empty_means_all() -> void:
+	assert_eq(CombatEventBatchScript.types_to_mask([]), CombatEventBatchScript.ALL_TYPES_MASK,
+		"Empty filter should match all types")
+
+
+# =============================================================================
+# DELIVERY TESTS
+# =============================================================================
+
+func test_events_delivered_once_per_flush() -> void:
+	_event_bus.subscribe_combat_events(_record_batch)
+	_event_bus.queue_tower_attack_started(_node, _node)
+	_event_bus.queue_tower_attack_hit(_node, _node, 10.0, false)
+	_event_bus.queue_floating_text(Vector2.ZERO, "10", Color.WHITE)
+
+	assert_eq(_received.size(), 0, "Nothing should be delivered before flush")
+	_event_bus.flush_combat_events()
+	assert_eq(_received.size(), 1, "Subscriber should be called once")
+	assert_eq(_received[0].size(), 3, "Batch should hold all three events")
+
+
+func test_flush_with_no_events_does_not_call_subscriber() -> void:
+	_event_bus.subscribe_combat_events(_record_batch)
+	_event_bus.flush_combat_events()
+	assert_eq(_received.size(), 0, "Subscriber should not be called for an empty frame")
+
+
+func test_flush_clears_pending_events() -> void:
+	_event_bus.subscribe_combat_events(_record_batch)
+	_event_bus.queue_tower_attack_started(_node, _node)
+	_event_bus.flush_combat_events()
+	assert_eq(_event_bus.get_pending_combat_event_count(), 0, "Pending events should be cleared")
+	_event_bus.flush_combat_events()
+	assert_eq(_received.size(), 1, "Events should not be delivered twice")
+
+
+func test_type_filter_limits_delivered_events() -> void:
+	_event_bus.subscribe_combat_events(_record_batch, [CombatEventBatchScript.Type.ATTACK_HIT])
+	_event_bus.queue_tower_attack_started(_node, _node)
+	_event_bus.queue_tower_attack_hit(_node, _node, 10.0, true)
+	_event_bus.flush_combat_events()
+
+	assert_eq(_received.size(), 1, "Subscriber should be called once")
+	assert_eq(_received[0], PackedByteArray([CombatEventBatchScript.Type.ATTACK_HIT]),
+		"Only ATTACK_HIT events should be delivered")
+
+
+func test_filtered_subscriber_skipped_when_no_match() -> void:
+	_event_bus.subscribe_combat_events(_record_batch, [CombatEventBatchScript.Type.ENEMY_DAMAGED])
+	_event_bus.subscribe_combat_events(func(_batch): pass)
+	_event_bus.queue_tower_attack_started(_node, _node)
+	_event_bus.flush_combat_events()
+	assert_eq(_received.size(), 0, "Filtered subscriber should not get an empty batch")
+
+
+func test_events_not_buffered_without_subscribers() -> void:
+	_event_bus.queue_tower_attack_started(_node, _node)
+	assert_eq(_event_bus.get_pending_combat_event_count(), 0,
+		"Events nobody listens to should not be buffered")
+
+
+func test_unsubscribe_stops_delivery() -> void:
+	_event_bus.subscribe_combat_events(_record_batch)
+	_event_bus.unsubscribe_combat_events(_record_batch)
+	assert_false(_event_bus.is_subscribed_to_combat_events(_record_batch),
+		"Callback should no longer be subscribed")
+	_event_bus.queue_tower_attack_started(_node, _node)
+	_event_bus.flush_combat_events()
+	assert_eq(_received.size(), 0, "Unsubscribed callback should not be called")
+
+
+func test_resubscribe_replaces_filter() -> void:
+	_event_bus.subscribe_combat_events(_record_batch, [CombatEventBatchScript.Type.ATTACK_HIT])
+	_event_bus.subscribe_combat_events(_record_batch, [CombatEventBatchScript.Type.ATTACK_STARTED])
+	assert_eq(_event_bus.get_combat_event_subscriber_count(CombatEventBatchScript.Type.ATTACK_HIT), 0,
+		"Old filter should be replaced")
+	assert_eq(_event_bus.get_combat_event_subscriber_count(CombatEventBatchScript.Type.ATTACK_STARTED), 1,
+		"New filter should apply")
+
+
+func test_nested_flush_from_subscriber_is_ignored() -> void:
+	var reentrant = func(_batch):
+		_event_bus.queue_tower_attack_started(_node, _node)
+		_event_bus.flush_combat_events()
+	_event_bus.subscribe_combat_events(reentrant)
+	_event_bus.subscribe_combat_events(_record_batch)
+	_event_bus.queue_tower_attack_hit(_node, _node, 10.0, false)
+	_event_bus.flush_combat_events()
+
+	assert_eq(_received.size(), 1, "Later subscriber should be called once")
+	assert_eq(_received[0], PackedByteArray([CombatEventBatchScript.Type.ATTACK_HIT]),
+		"Later subscriber should see only the original event")
+	assert_eq(_event_bus.get_pending_combat_event_count(), 1,
+		"Event queued during delivery should stay pending")
+	assert_true(_event_bus.is_processing(), "Pending event should keep the bus processing")
+
+
+func test_unsubscribe_during_delivery_takes_effect_immediately() -> void:
+	var unsubscriber = func(_batch):
+		_event_bus.unsubscribe_combat_events(_record_batch)
+	_event_bus.subscribe_combat_events(unsubscriber)
+	_event_bus.subscribe_combat_events(_record_batch)
+	_event_bus.queue_tower_attack_started(_node, _node)
+	_event_bus.flush_combat_events()
+	assert_eq(_received.size(), 0, "Callback unsubscribed during delivery should not be called")
+
+
+# =============================================================================
+# FRAME DELIVERY TESTS
+# =============================================================================
+
+func test_events_delivered_automatically_once_per_frame() -> void:
+	_event_bus.subscribe_combat_events(_record_batch)
+	_event_bus.queue_tower_attack_started(_node, _node)
+	_event_bus.queue_tower_attack_hit(_node, _node, 10.0, false)
+	assert_true(_event_bus.is_processing(), "Queueing should enable processing")
+
+	await _wait_for_frame_end()
+
+	assert_eq(_received.size(), 1, "Subscriber should be called exactly once")
+	assert_eq(_received[0].size(), 2, "Batch should hold both events")
+	assert_eq(_event_bus.get_pending_combat_event_count(), 0, "Pending events should be cleared")
+	assert_false(_event_bus.is_processing(), "Processing should stop once the buffer is empty")
+
+
+func test_event_queued_during_delivery_arrives_next_frame() -> void:
+	var queue_once = [true]
+	var requeue = func(_batch):
+		if queue_once[0]:
+			queue_once[0] = false
+			_event_bus.queue_tower_attack_hit(_node, _node, 5.0, false)
+	_event_bus.subscribe_combat_events(requeue)
+	_event_bus.subscribe_combat_events(_record_batch)
+	_event_bus.queue_tower_attack_started(_node, _node)
+
+	await _wait_for_frame_end()
+	await _wait_for_frame_end()
+
+	assert_eq(_received.size(), 2, "Subscriber should be called on two frames")
+	assert_eq(_received[0], PackedByteArray([CombatEventBatchScript.Type.ATTACK_STARTED]),
+		"First frame should only hold the original event")
+	assert_eq(_received[1], PackedByteArray([CombatEventBatchScript.Type.ATTACK_HIT]),
+		"Requeued event should arrive in the next batch")
+	assert_eq(_received_frames[1], _received_frames[0] + 1,
+		"Requeued event should arrive on the following frame")
+
+
+# =============================================================================
+# STATS TESTS
+# =============================================================================
+
+func test_emit_counts_track_each_type() -> void:
+	_event_bus.queue_tower_attack_started(_node, _node)
+	_event_bus.queue_tower_attack_started(_node, _node)
+	_event_bus.queue_enemy_damaged(_node, 3.0, null, "burn")
+
+	assert_eq(_event_bus.get_combat_event_emit_count(CombatEventBatchScript.Type.ATTACK_STARTED), 2,
+		"ATTACK_STARTED should be counted even without subscribers")
+	assert_eq(_event_bus.get_combat_event_emit_count(CombatEventBatchScript.Type.ENEMY_DAMAGED), 1,
+		"ENEMY_DAMAGED should be counted")
+	assert_eq(_event_bus.get_combat_event_emit_count(CombatEventBatchScript.Type.ATTACK_HIT), 0,
+		"ATTACK_HIT should not be counted")
+
+
+func test_subscriber_counts_respect_filters() -> void:
+	_event_bus.subscribe_combat_events(_record_batch, [CombatEventBatchScript.Type.FLOATING_TEXT])
+	_event_bus.subscribe_combat_events(func(_batch): pass)
+
+	assert_eq(_event_bus.get_combat_event_subscriber_count(CombatEventBatchScript.Type.FLOATING_TEXT), 2,
+		"Both subscribers receive FLOATING_TEXT")
+	assert_eq(_event_bus.get_combat_event_subscriber_count(CombatEventBatchScript.Type.ATTACK_HIT), 1,
+		"Only the unfiltered subscriber receives ATTACK_HIT")
+
+
+func test_stats_dictionary_and_reset() -> void:
+	_event_bus.subscribe_combat_events(_record_batch)
+	_event_bus.show_damage_number(Vector2.ZERO, 12.0, true)
+	_event_bus.flush_combat_events()
+
+	var stats = _event_bus.get_combat_event_stats()
+	assert_eq(stats["flushes"], 1, "One flush should be recorded")
+	assert_eq(stats["events"]["FLOATING_TEXT"]["emitted"], 1, "Damage number should be counted")
+	assert_eq(stats["events"]["FLOATING_TEXT"]["subscribers"], 1, "Subscriber should be counted")
+
+	_event_bus.reset_combat_event_stats()
+	assert_eq(_event_bus.get_combat_event_emit_count(CombatEventBatchScript.Type.FLOATING_TEXT), 0,
+		"Emit counts should reset")
+	assert_eq(_event_bus.get_combat_event_stats()["flushes"], 0, "Flush count should reset")
+
+
+func test_emit_count_out_of_range_returns_zero() -> void:
+	assert_eq(_event_bus.get_combat_event_emit_count(-1), 0, "Negative type should return 0")
+	assert_eq(_event_bus.get_combat_event_emit_count(CombatEventBatchScript.TYPE_COUNT), 0,
+		"Unknown type should return 0")